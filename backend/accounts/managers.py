@@ -7,6 +7,7 @@ from django.contrib.auth.hashers import make_password
 from django.core.exceptions import ImproperlyConfigured
 from django.db import DatabaseError, IntegrityError, connection, transaction
 
+from api.rbac import invalidate_rbac
 from masterdata.services.data_access import check_warehouse_managed_by_tenant
 from masterdata.services.iam_data_access import (
     UserCreateRecordError,
@@ -282,3 +283,4 @@ class DmisUserManager(BaseUserManager):
                     actor_label,
                 ],
             )
+        transaction.on_commit(invalidate_rbac)
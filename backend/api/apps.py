@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import contextvars
 import logging
+import logging.handlers
+import os
+import queue
 import re
+import threading
 import uuid
+import weakref
 
 from django.apps import AppConfig
 from django.conf import settings
@@ -55,20 +60,20 @@ def get_request_id(request=None) -> str:
 
 
 def build_log_extra(request=None, **extra) -> dict[str, object]:
-    context = dict(_request_log_context.get({}))
-    payload: dict[str, object] = {
-        "request_id": context.get("request_id", "-"),
-        "request_method": context.get("request_method", "-"),
-        "request_path": context.get("request_path", "-"),
-    }
+    payload: dict[str, object]
     if request is not None:
-        payload.update(
-            {
-                "request_id": get_request_id(request),
-                "request_method": str(getattr(request, "method", "") or "-"),
-                "request_path": str(getattr(request, "path", "") or "-"),
-            }
-        )
+        payload = {
+            "request_id": get_request_id(request),
+            "request_method": str(getattr(request, "method", "") or "-"),
+            "request_path": str(getattr(request, "path", "") or "-"),
+        }
+    else:
+        context = _request_log_context.get({})
+        payload = {
+            "request_id": context.get("request_id", "-"),
+            "request_method": context.get("request_method", "-"),
+            "request_path": context.get("request_path", "-"),
+        }
     for key, value in extra.items():
         if value is None:
             continue
@@ -99,6 +104,197 @@ class RequestContextLogFilter(logging.Filter):
         return True
 
 
+class AuditEventTypeFilter(logging.Filter):
+    """Drop routine audit records whose event_type is listed in DMIS_AUDIT_SUPPRESS_EVENT_TYPES."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        suppressed = getattr(settings, "DMIS_AUDIT_SUPPRESS_EVENT_TYPES", None)
+        if not suppressed or record.levelno >= logging.WARNING:
+            return True
+        return str(getattr(record, "event_type", "") or "").upper() not in suppressed
+
+
+class DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """
+    Bounded, non-blocking queue handler.
+
+    Request threads never wait on a full queue: the oldest pending record is
+    discarded to make room and counted, so a log burst costs bounded memory
+    instead of request latency.
+    """
+
+    default_maxsize = 10000
+
+    def __init__(self, log_queue: queue.Queue | None = None, *, maxsize: int | None = None) -> None:
+        if log_queue is None:
+            log_queue = queue.Queue(maxsize=maxsize or self.default_maxsize)
+        super().__init__(log_queue)
+        self._dropped_lock = threading.Lock()
+        self._dropped_count = 0
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    def _note_dropped(self) -> None:
+        with self._dropped_lock:
+            self._dropped_count += 1
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self._note_dropped()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Another producer refilled the slot; drop this record instead of blocking.
+            self._note_dropped()
+
+
+class _BatchFlushStreamHandler(logging.StreamHandler):
+    # Writes every record but only flushes the stream once the listener has
+    # drained its backlog (or on ERROR+), so bursts become one buffered write.
+    flush_level = logging.ERROR
+
+    def __init__(self, stream=None, *, backlog_empty) -> None:
+        super().__init__(stream)
+        self._backlog_empty = backlog_empty
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level or self._backlog_empty():
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _DrainingQueueListener(logging.handlers.QueueListener):
+    # The stock listener enqueues its stop sentinel with put_nowait, which
+    # raises queue.Full on a saturated bounded queue and leaves the thread
+    # running. Give the thread a moment to drain, then discard (and count) the
+    # oldest records until the sentinel fits. After each record it also writes
+    # a report when the owning handler has dropped records since the last one.
+    sentinel_timeout = 1.0
+
+    def __init__(self, log_queue: queue.Queue, *handlers, owner: QueuedStreamHandler) -> None:
+        super().__init__(log_queue, *handlers)
+        self._owner = owner
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        report = self._owner._dropped_report_record()
+        if report is not None:
+            super().handle(report)
+
+    def enqueue_sentinel(self) -> None:
+        try:
+            self.queue.put(self._sentinel, timeout=self.sentinel_timeout)
+            return
+        except queue.Full:
+            pass
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self._owner._note_dropped()
+            try:
+                self.queue.put_nowait(self._sentinel)
+                return
+            except queue.Full:
+                continue
+
+
+class QueuedStreamHandler(DropOldestQueueHandler):
+    """
+    Console handler that formats on the calling thread and writes on a listener thread.
+
+    Request threads only enqueue; stream I/O happens in a background
+    QueueListener, which flushes once per drained burst. Closing the handler
+    (logging.shutdown or a dictConfig reload) drains the queue and stops the
+    listener.
+    """
+
+    def __init__(self, stream=None, *, maxsize: int | None = None) -> None:
+        super().__init__(maxsize=maxsize)
+        self._stream_handler = _BatchFlushStreamHandler(
+            stream,
+            backlog_empty=lambda: self.queue.empty(),
+        )
+        self._listener_lock = threading.Lock()
+        self._reported_dropped_count = 0
+        self.listener: logging.handlers.QueueListener | None = None
+        self._start_listener()
+        if hasattr(os, "register_at_fork"):
+            handler_ref = weakref.ref(self)
+
+            def _restart_in_child() -> None:
+                handler = handler_ref()
+                if handler is not None:
+                    handler._restart_after_fork()
+
+            os.register_at_fork(after_in_child=_restart_in_child)
+
+    def _start_listener(self) -> None:
+        self.listener = _DrainingQueueListener(self.queue, self._stream_handler, owner=self)
+        self.listener.start()
+
+    def _dropped_report_record(self) -> logging.LogRecord | None:
+        # Called on the listener thread (and once more on close); only that
+        # path advances the reported count, so each drop is reported once.
+        dropped = self._dropped_count - self._reported_dropped_count
+        if dropped <= 0:
+            return None
+        self._reported_dropped_count += dropped
+        record = logging.LogRecord(
+            "dmis.runtime",
+            logging.WARNING,
+            __file__,
+            0,
+            "dropped %d log records since last report",
+            (dropped,),
+            None,
+        )
+        record.event = "logging.records_dropped"
+        self.filter(record)
+        return self.prepare(record)
+
+    def _restart_after_fork(self) -> None:
+        # The parent's listener thread does not survive fork and the queue's
+        # locks may have been held mid-operation, so start clean in the child.
+        if self.listener is None:
+            return
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self._listener_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        self._dropped_count = 0
+        self._reported_dropped_count = 0
+        self._start_listener()
+
+    def close(self) -> None:
+        with self._listener_lock:
+            listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+            report = self._dropped_report_record()
+            if report is not None:
+                self._stream_handler.handle(report)
+            self._stream_handler.flush()
+        super().close()
+
+
 class DmisRequestContextMiddleware(MiddlewareMixin):
     response_header_name = "X-Request-ID"
 
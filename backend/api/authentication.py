@@ -1,6 +1,7 @@
 import logging
 import warnings
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import jwt
@@ -49,6 +50,19 @@ def _log_auth_warning(
     logger.warning(event, extra=payload)
 
 
+@lru_cache(maxsize=4)
+def _jwks_client(jwks_url: str) -> PyJWKClient:
+    # One client per JWKS URL, so the fetched key set is reused across
+    # requests instead of hitting the IdP on every authentication. Only the
+    # JWK set is cached, and only for AUTH_JWKS_CACHE_SECONDS: per-kid caching
+    # (cache_keys=True) never expires and would keep trusting a key the IdP
+    # has removed. Unknown ``kid`` values still force an immediate refetch.
+    return PyJWKClient(
+        jwks_url,
+        lifespan=getattr(settings, "AUTH_JWKS_CACHE_SECONDS", 300),
+    )
+
+
 def _verify_jwt_with_jwks(token: str, jwks_url: str) -> dict:
     if not jwks_url:
         raise AuthenticationFailed("JWKS URL is not configured.")
@@ -61,7 +75,7 @@ def _verify_jwt_with_jwks(token: str, jwks_url: str) -> dict:
         if alg not in allowed_algs:
             raise AuthenticationFailed("JWT alg is not allowed.")
 
-        jwk_client = PyJWKClient(jwks_url)
+        jwk_client = _jwks_client(jwks_url)
         signing_key = jwk_client.get_signing_key_from_jwt(token)
 
         options = {
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import uuid
 from typing import Iterable, Tuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import DatabaseError, connection
 import logging
 
@@ -10,6 +12,15 @@ from api.authentication import Principal
 
 logger = logging.getLogger(__name__)
 
+# Shared (Redis-backed) cache of the user_role/role_permission lookups keyed by
+# user_id. Entries carry the RBAC version they were read under; every writer of
+# user_role/role_permission replaces the version via invalidate_rbac(), which
+# makes all cached entries stale for every process at once. The TTL only
+# bounds how long unused entries linger.
+_RBAC_CACHE_TTL_SECONDS = 30
+_RBAC_CACHE_VERSION_KEY = "dmis:rbac:version"
+_RBAC_CACHE_USER_KEY = "dmis:rbac:user:{user_id}"
+
 REQUIRED_PERMISSION = "replenishment.needs_list.preview"
 PERM_NEEDS_LIST_CREATE_DRAFT = "replenishment.needs_list.create_draft"
 PERM_NEEDS_LIST_EDIT_LINES = "replenishment.needs_list.edit_lines"
@@ -549,9 +560,10 @@ def resolve_roles_and_permissions(
         try:
             user_id = _resolve_user_id(principal)
             if user_id is not None:
-                roles = _dedupe_preserve_order(list(roles) + _fetch_roles(user_id))
+                user_roles, user_permissions = _fetch_user_rbac(user_id)
+                roles = _dedupe_preserve_order(list(roles) + list(user_roles))
                 permissions = _dedupe_preserve_order(
-                    list(permissions) + list(_fetch_permissions(user_id))
+                    list(permissions) + list(user_permissions)
                 )
             if roles:
                 permissions = _dedupe_preserve_order(
@@ -608,6 +620,59 @@ def _resolve_user_id(principal: Principal) -> int | None:
         return int(row[0]) if row else None
 
 
+def invalidate_rbac() -> None:
+    """Invalidate cached RBAC lookups for every user in every process.
+
+    Call after committing any change to ``user_role`` or ``role_permission``.
+    """
+    try:
+        cache.set(_RBAC_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    except Exception:
+        logger.exception("RBAC cache invalidation failed")
+
+
+def _ensure_rbac_version() -> str:
+    # The version key is missing (first use or eviction); install a fresh one,
+    # or adopt whichever token a concurrent caller installed first.
+    candidate = uuid.uuid4().hex
+    if cache.add(_RBAC_CACHE_VERSION_KEY, candidate, timeout=None):
+        return candidate
+    return str(cache.get(_RBAC_CACHE_VERSION_KEY) or candidate)
+
+
+def _fetch_user_rbac(user_id: int) -> tuple[tuple[str, ...], frozenset[str]]:
+    user_key = _RBAC_CACHE_USER_KEY.format(user_id=user_id)
+    version = None
+    try:
+        # One round trip for both keys. The version is captured before the
+        # database queries so an invalidation that lands mid-query leaves the
+        # stored entry already stale.
+        cached = cache.get_many([_RBAC_CACHE_VERSION_KEY, user_key])
+        version = cached.get(_RBAC_CACHE_VERSION_KEY)
+        entry = cached.get(user_key)
+        if version is None:
+            version = _ensure_rbac_version()
+            entry = None
+    except Exception as exc:
+        logger.warning("RBAC cache lookup failed: %s", exc)
+        entry = None
+    if entry is not None and entry[0] == version:
+        return entry[1], entry[2]
+
+    roles = tuple(_fetch_roles(user_id))
+    permissions = frozenset(_fetch_permissions(user_id))
+    if version is not None:
+        try:
+            cache.set(
+                user_key,
+                (version, roles, permissions),
+                timeout=_RBAC_CACHE_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("RBAC cache store failed: %s", exc)
+    return roles, permissions
+
+
 def _fetch_roles(user_id: int) -> list[str]:
     with connection.cursor() as cursor:
         cursor.execute(
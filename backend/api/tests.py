@@ -1,14 +1,19 @@
+import json
+import logging
 import os
 import sys
+import threading
+import time
 import types
 from datetime import datetime, timedelta
 from decimal import Decimal
-from io import StringIO
+from io import BytesIO, StringIO
 from importlib import import_module
 from importlib.machinery import PathFinder
 from pathlib import Path
 from types import SimpleNamespace
 from django.apps import apps as django_apps
+from django.core.cache import cache
 from django.core.management import call_command
 from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import path
@@ -18,13 +23,20 @@ from rest_framework.decorators import api_view
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.response import Response
 from rest_framework.test import APIClient
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from api import authentication, checks as api_checks
+from api.apps import (
+    AuditEventTypeFilter,
+    DropOldestQueueHandler,
+    QueuedStreamHandler,
+    _BatchFlushStreamHandler,
+    _DrainingQueueListener,
+)
 from api import rbac
 from api.authentication import Principal
 from accounts.models import DmisUser
@@ -1954,6 +1966,157 @@ class RequestContextMiddlewareTests(SimpleTestCase):
         self.assertEqual(mock_exception.call_args.kwargs["extra"]["exception_class"], "RuntimeError")
 
 
+class AuditEventTypeFilterTests(SimpleTestCase):
+    def _record(self, level: int, event_type: str | None) -> logging.LogRecord:
+        record = logging.LogRecord("dmis.audit", level, __file__, 1, "audit", None, None)
+        if event_type is not None:
+            record.event_type = event_type
+        return record
+
+    @override_settings(DMIS_AUDIT_SUPPRESS_EVENT_TYPES=frozenset({"READ"}))
+    def test_suppressed_event_type_is_dropped_below_warning(self) -> None:
+        audit_filter = AuditEventTypeFilter()
+
+        self.assertFalse(audit_filter.filter(self._record(logging.INFO, "read")))
+        self.assertTrue(audit_filter.filter(self._record(logging.INFO, "CREATE")))
+        self.assertTrue(audit_filter.filter(self._record(logging.WARNING, "READ")))
+
+    @override_settings(DMIS_AUDIT_SUPPRESS_EVENT_TYPES=frozenset())
+    def test_empty_suppression_allows_all_records(self) -> None:
+        self.assertTrue(AuditEventTypeFilter().filter(self._record(logging.INFO, "READ")))
+
+
+class DropOldestQueueHandlerTests(SimpleTestCase):
+    def _record(self, message: str) -> logging.LogRecord:
+        return logging.LogRecord("dmis.test", logging.INFO, __file__, 1, message, None, None)
+
+    def test_full_queue_drops_oldest_record_and_counts_it(self) -> None:
+        handler = DropOldestQueueHandler(maxsize=2)
+
+        for message in ("first", "second", "third"):
+            handler.handle(self._record(message))
+
+        self.assertEqual(handler.dropped_count, 1)
+        queued = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+        self.assertEqual(queued, ["second", "third"])
+
+    def test_enqueue_does_not_drop_while_capacity_remains(self) -> None:
+        handler = DropOldestQueueHandler(maxsize=5)
+
+        handler.handle(self._record("only"))
+
+        self.assertEqual(handler.dropped_count, 0)
+        self.assertEqual(handler.queue.qsize(), 1)
+
+
+class QueuedStreamHandlerTests(SimpleTestCase):
+    def test_records_are_written_by_listener_and_drained_on_close(self) -> None:
+        stream = StringIO()
+        handler = QueuedStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+        handler.handle(
+            logging.LogRecord("dmis.test", logging.WARNING, __file__, 1, "queued %s", ("event",), None)
+        )
+        handler.close()
+
+        self.assertEqual(stream.getvalue(), "WARNING queued event\n")
+        self.assertIsNone(handler.listener)
+
+    def test_listener_defers_flush_until_backlog_is_drained(self) -> None:
+        stream = MagicMock()
+        backlog = [True, False]
+        handler = _BatchFlushStreamHandler(stream, backlog_empty=lambda: not backlog.pop(0))
+
+        for message in ("first", "second"):
+            handler.emit(logging.LogRecord("dmis.test", logging.INFO, __file__, 1, message, None, None))
+
+        self.assertEqual(stream.write.call_count, 2)
+        stream.flush.assert_called_once()
+
+    def test_dropped_records_are_reported_through_the_stream(self) -> None:
+        stream = StringIO()
+        handler = QueuedStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        handler._note_dropped()
+        handler._note_dropped()
+
+        handler.handle(logging.LogRecord("dmis.test", logging.INFO, __file__, 1, "after drops", None, None))
+        handler.close()
+
+        self.assertEqual(
+            stream.getvalue(),
+            "INFO after drops\nWARNING dropped 2 log records since last report\n",
+        )
+
+    def test_restart_after_fork_replaces_inherited_locks_and_counters(self) -> None:
+        stream = StringIO()
+        handler = QueuedStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        parent_listener = handler.listener
+        handler._note_dropped()
+        # Simulate a parent thread holding the drop lock at fork time.
+        handler._dropped_lock.acquire()
+
+        handler._restart_after_fork()
+        parent_listener.stop()
+
+        self.assertFalse(handler._dropped_lock.locked())
+        self.assertEqual(handler.dropped_count, 0)
+        self.assertIsNot(handler.listener, parent_listener)
+        handler._note_dropped()
+        handler.handle(logging.LogRecord("dmis.test", logging.INFO, __file__, 1, "child", None, None))
+        handler.close()
+
+        self.assertEqual(stream.getvalue(), "child\ndropped 1 log records since last report\n")
+
+    def test_close_is_idempotent(self) -> None:
+        handler = QueuedStreamHandler(StringIO())
+
+        handler.close()
+        handler.close()
+
+        self.assertIsNone(handler.listener)
+
+    @patch.object(_DrainingQueueListener, "sentinel_timeout", 0.01)
+    def test_close_on_full_queue_stops_listener(self) -> None:
+        release = threading.Event()
+        written: list[str] = []
+
+        class BlockedStream:
+            def write(self, text: str) -> None:
+                release.wait(5)
+                written.append(text)
+
+            def flush(self) -> None:
+                pass
+
+        handler = QueuedStreamHandler(BlockedStream(), maxsize=3)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+        def record(message: str) -> logging.LogRecord:
+            return logging.LogRecord("dmis.test", logging.INFO, __file__, 1, message, None, None)
+
+        handler.handle(record("in-flight"))
+        deadline = time.monotonic() + 5
+        while not handler.queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.001)
+        for message in ("first", "second", "third"):
+            handler.handle(record(message))
+        self.assertTrue(handler.queue.full())
+        listener = handler.listener
+
+        threading.Timer(0.05, release.set).start()
+        handler.close()
+
+        self.assertIsNone(handler.listener)
+        self.assertIsNone(listener._thread)
+        self.assertEqual(written[0], "in-flight\n")
+        self.assertEqual(written[-1], "third\n")
+        self.assertEqual(handler.dropped_count, 1)
+        self.assertIn("dropped 1 log records since last report\n", written)
+
+
 class AuthLoggingTests(SimpleTestCase):
     @override_settings(
         AUTH_ENABLED=False,
@@ -2017,6 +2180,98 @@ class AuthLoggingTests(SimpleTestCase):
         )
 
 
+class JwksVerificationTests(SimpleTestCase):
+    def setUp(self) -> None:
+        authentication._jwks_client.cache_clear()
+        self.addCleanup(authentication._jwks_client.cache_clear)
+
+    def test_jwks_client_is_reused_per_url(self) -> None:
+        with patch("api.authentication.PyJWKClient") as mock_client_cls:
+            first = authentication._jwks_client("https://issuer.example/jwks.json")
+            second = authentication._jwks_client("https://issuer.example/jwks.json")
+            authentication._jwks_client("https://other.example/jwks.json")
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_client_cls.call_count, 2)
+        mock_client_cls.assert_any_call(
+            "https://issuer.example/jwks.json",
+            lifespan=300,
+        )
+
+    @override_settings(
+        AUTH_ISSUER="",
+        AUTH_AUDIENCE="",
+        AUTH_ALGORITHMS=["RS256"],
+    )
+    @patch("api.authentication.jwt.decode", return_value={"sub": "user-1"})
+    @patch("api.authentication.jwt.get_unverified_header", return_value={"alg": "RS256"})
+    @patch("api.authentication._jwks_client")
+    def test_verify_jwt_uses_cached_jwks_client(
+        self,
+        mock_jwks_client,
+        _mock_get_unverified_header,
+        mock_decode,
+    ) -> None:
+        signing_key = mock_jwks_client.return_value.get_signing_key_from_jwt.return_value
+
+        payload = authentication._verify_jwt_with_jwks(
+            "header.payload.signature",
+            "https://issuer.example/.well-known/jwks.json",
+        )
+
+        self.assertEqual(payload, {"sub": "user-1"})
+        mock_jwks_client.assert_called_once_with("https://issuer.example/.well-known/jwks.json")
+        mock_jwks_client.return_value.get_signing_key_from_jwt.assert_called_once_with(
+            "header.payload.signature"
+        )
+        self.assertIs(mock_decode.call_args.args[1], signing_key.key)
+
+    @override_settings(
+        AUTH_ISSUER="",
+        AUTH_AUDIENCE="",
+        AUTH_ALGORITHMS=["HS256"],
+        AUTH_JWKS_CACHE_SECONDS=300,
+    )
+    def test_removed_kid_is_rejected_once_jwks_cache_expires(self) -> None:
+        old_key = {
+            "kty": "oct",
+            "kid": "old",
+            "alg": "HS256",
+            "k": "b2xkLXNpZ25pbmcta2V5LW9sZC1zaWduaW5nLWtleQ",
+        }
+        new_key = {**old_key, "kid": "new", "k": "bmV3LXNpZ25pbmcta2V5LW5ldy1zaWduaW5nLWtleQ"}
+        served = {"keys": [old_key]}
+        token = authentication.jwt.encode(
+            {"sub": "user-1"},
+            authentication.jwt.PyJWK(old_key).key,
+            algorithm="HS256",
+            headers={"kid": "old"},
+        )
+        now = [1000.0]
+        jwks_url = "https://issuer.example/.well-known/jwks.json"
+
+        with (
+            patch(
+                "jwt.jwks_client.urllib.request.urlopen",
+                side_effect=lambda *_args, **_kwargs: BytesIO(json.dumps(served).encode()),
+            ) as mock_urlopen,
+            patch("jwt.jwk_set_cache.time.monotonic", side_effect=lambda: now[0]),
+        ):
+            self.assertEqual(
+                authentication._verify_jwt_with_jwks(token, jwks_url),
+                {"sub": "user-1"},
+            )
+
+            served = {"keys": [new_key]}
+            now[0] += 60
+            authentication._verify_jwt_with_jwks(token, jwks_url)
+            self.assertEqual(mock_urlopen.call_count, 1)
+
+            now[0] += 300
+            with self.assertRaises(AuthenticationFailed):
+                authentication._verify_jwt_with_jwks(token, jwks_url)
+
+
 class AuthJwtAutoProvisionTests(TestCase):
     user_ids = (990001, 990002, 990003)
 
@@ -2625,6 +2880,94 @@ class AuthWhoAmITests(TestCase):
 
 
 class RbacResolutionTests(TestCase):
+    def setUp(self) -> None:
+        cache.delete(rbac._RBAC_CACHE_VERSION_KEY)
+        self.addCleanup(cache.delete, rbac._RBAC_CACHE_VERSION_KEY)
+
+    @patch("api.rbac._fetch_permissions_for_role_codes", return_value=set())
+    @patch("api.rbac._fetch_permissions", return_value={"replenishment.needs_list.approve"})
+    @patch("api.rbac._fetch_roles", return_value=["ODPEM_DIR_PEOD"])
+    @patch("api.rbac._resolve_user_id", return_value=42)
+    @patch("api.rbac._db_rbac_enabled", return_value=True)
+    def test_db_rbac_user_lookups_are_cached_across_requests_until_invalidated(
+        self,
+        _mock_db_enabled,
+        _mock_user_id,
+        mock_fetch_roles,
+        mock_fetch_permissions,
+        _mock_permissions_for_roles,
+    ) -> None:
+        principal = Principal(user_id="42", username="director", roles=[], permissions=[])
+
+        for _ in range(2):
+            roles, permissions = rbac.resolve_roles_and_permissions(
+                type("Request", (), {})(), principal
+            )
+            self.assertIn("ODPEM_DIR_PEOD", roles)
+            self.assertIn("replenishment.needs_list.approve", permissions)
+
+        self.assertEqual(mock_fetch_roles.call_count, 1)
+        self.assertEqual(mock_fetch_permissions.call_count, 1)
+
+        self.assertIsNotNone(cache.get("dmis:rbac:user:42"))
+
+        rbac.invalidate_rbac()
+        rbac.resolve_roles_and_permissions(type("Request", (), {})(), principal)
+
+        self.assertEqual(mock_fetch_roles.call_count, 2)
+        self.assertEqual(mock_fetch_permissions.call_count, 2)
+
+    @patch("api.rbac._fetch_permissions_for_role_codes", return_value=set())
+    @patch("api.rbac._fetch_permissions", return_value={"replenishment.needs_list.approve"})
+    @patch("api.rbac._fetch_roles", return_value=["ODPEM_DIR_PEOD"])
+    @patch("api.rbac._resolve_user_id", return_value=42)
+    @patch("api.rbac._db_rbac_enabled", return_value=True)
+    def test_db_rbac_cache_hit_reads_version_and_entry_in_one_call(
+        self,
+        _mock_db_enabled,
+        _mock_user_id,
+        mock_fetch_roles,
+        _mock_fetch_permissions,
+        _mock_permissions_for_roles,
+    ) -> None:
+        principal = Principal(user_id="42", username="director", roles=[], permissions=[])
+        rbac.resolve_roles_and_permissions(type("Request", (), {})(), principal)
+
+        with (
+            patch("api.rbac.cache.get_many", wraps=cache.get_many) as mock_get_many,
+            patch("api.rbac.cache.add", wraps=cache.add) as mock_add,
+        ):
+            rbac.resolve_roles_and_permissions(type("Request", (), {})(), principal)
+
+        mock_get_many.assert_called_once_with([rbac._RBAC_CACHE_VERSION_KEY, "dmis:rbac:user:42"])
+        mock_add.assert_not_called()
+        self.assertEqual(mock_fetch_roles.call_count, 1)
+
+    @patch("api.rbac._fetch_permissions_for_role_codes", return_value=set())
+    @patch("api.rbac._fetch_permissions", return_value={"replenishment.needs_list.approve"})
+    @patch("api.rbac._fetch_roles", return_value=["ODPEM_DIR_PEOD"])
+    @patch("api.rbac._resolve_user_id", return_value=42)
+    @patch("api.rbac._db_rbac_enabled", return_value=True)
+    @patch("api.rbac.cache.get_many", side_effect=ConnectionError("cache down"))
+    def test_db_rbac_falls_back_to_database_when_cache_is_unavailable(
+        self,
+        _mock_cache_get,
+        _mock_db_enabled,
+        _mock_user_id,
+        mock_fetch_roles,
+        _mock_fetch_permissions,
+        _mock_permissions_for_roles,
+    ) -> None:
+        principal = Principal(user_id="42", username="director", roles=[], permissions=[])
+
+        roles, permissions = rbac.resolve_roles_and_permissions(
+            type("Request", (), {})(), principal
+        )
+
+        self.assertIn("ODPEM_DIR_PEOD", roles)
+        self.assertIn("replenishment.needs_list.approve", permissions)
+        self.assertEqual(mock_fetch_roles.call_count, 1)
+
     @patch(
         "api.rbac._fetch_permissions_for_role_codes",
         return_value={"replenishment.needs_list.approve"},
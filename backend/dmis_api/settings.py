@@ -809,6 +809,12 @@ else:
             "PASSWORD": os.getenv("DB_PASSWORD", ""),
             "HOST": os.getenv("DB_HOST", ""),
             "PORT": os.getenv("DB_PORT", "5432"),
+            # Keep each worker's connection open across requests instead of
+            # reconnecting per request; health checks replace stale ones.
+            # Tests close per request so worker-thread connections cannot
+            # hold the test database open at teardown.
+            "CONN_MAX_AGE": 0 if TESTING else _get_int_env("DB_CONN_MAX_AGE", 60),
+            "CONN_HEALTH_CHECKS": _get_bool_env("DB_CONN_HEALTH_CHECKS", True),
         }
     }
 
@@ -981,6 +987,9 @@ AUTH_ENABLED = _get_bool_env(
 AUTH_ISSUER = os.getenv("AUTH_ISSUER", "")
 AUTH_AUDIENCE = os.getenv("AUTH_AUDIENCE", "")
 AUTH_JWKS_URL = os.getenv("AUTH_JWKS_URL", "")
+# How long a fetched JWK set is trusted before it is refetched; keys removed
+# from the IdP's JWKS stop verifying within this window.
+AUTH_JWKS_CACHE_SECONDS = max(_get_int_env("AUTH_JWKS_CACHE_SECONDS", 300) or 300, 1)
 AUTH_ALGORITHMS = [
     alg.strip()
     for alg in os.getenv("AUTH_ALGORITHMS", "RS256").split(",")
@@ -1179,6 +1188,13 @@ IFRC_AGENT = {
 }
 
 
+# Routine audit event types (for example READ) to drop on the dmis.audit logger
+# before any handler formats them. WARNING+ records (denials, failures) always flow.
+DMIS_AUDIT_SUPPRESS_EVENT_TYPES = frozenset(
+    event_type.upper() for event_type in _get_csv_env("DMIS_AUDIT_SUPPRESS", [])
+)
+
+
 if not TESTING:
     _dmis_log_level = os.getenv("DMIS_LOG_LEVEL", "INFO").strip().upper() or "INFO"
     _dmis_root_log_level = os.getenv("DMIS_ROOT_LOG_LEVEL", "WARNING").strip().upper() or "WARNING"
@@ -1188,7 +1204,10 @@ if not TESTING:
         "filters": {
             "request_context": {
                 "()": "api.apps.RequestContextLogFilter",
-            }
+            },
+            "audit_event_type": {
+                "()": "api.apps.AuditEventTypeFilter",
+            },
         },
         "formatters": {
             "structured": {
@@ -1203,7 +1222,7 @@ if not TESTING:
         },
         "handlers": {
             "console": {
-                "class": "logging.StreamHandler",
+                "()": "api.apps.QueuedStreamHandler",
                 "stream": "ext://sys.stdout",
                 "filters": ["request_context"],
                 "formatter": "structured",
@@ -1215,6 +1234,9 @@ if not TESTING:
                 "level": _dmis_log_level,
                 "propagate": False,
             },
+            "dmis.audit": {
+                "filters": ["audit_event_type"],
+            },
             "django.request": {
                 "handlers": ["console"],
                 "level": "ERROR",
@@ -23,6 +23,7 @@ import json
 import logging
 import os
 import re
+import threading
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
@@ -184,9 +185,33 @@ def _cb_record_success() -> None:
 
 # ─── Ollama LLM call ──────────────────────────────────────────────────────────
 
+_OLLAMA_MAX_CONNECTIONS = 10
+
+_ollama_client: Any = None
+_ollama_client_lock = threading.Lock()
+
+
+def _get_ollama_client():
+    """
+    Shared pooled httpx client so repeated classifications reuse the
+    keep-alive connection to Ollama instead of reconnecting per call.
+    """
+    global _ollama_client
+    if _ollama_client is None:
+        import httpx
+        with _ollama_client_lock:
+            if _ollama_client is None:
+                _ollama_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=_OLLAMA_MAX_CONNECTIONS,
+                        max_keepalive_connections=_OLLAMA_MAX_CONNECTIONS,
+                    ),
+                )
+    return _ollama_client
+
+
 def _call_ollama(prompt: str) -> dict:
-    import httpx
-    response = httpx.post(
+    response = _get_ollama_client().post(
         f"{_cfg('OLLAMA_BASE_URL')}/api/generate",
         json={
             "model":   _cfg("OLLAMA_MODEL_ID"),
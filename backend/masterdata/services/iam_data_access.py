@@ -5,6 +5,8 @@ from typing import Any
 
 from django.db import connection, transaction
 
+from api.rbac import invalidate_rbac
+
 
 class UserCreateRecordError(Exception):
     def __init__(self, warnings: list[str]):
@@ -76,7 +78,10 @@ def assign_user_role(user_id: int, role_id: int, assigned_by: Any) -> bool:
             """,
             [user_id, role_id, _assigned_by_value(assigned_by), actor_label, actor_label],
         )
-        return cursor.rowcount > 0
+        changed = cursor.rowcount > 0
+    if changed:
+        transaction.on_commit(invalidate_rbac)
+    return changed
 
 
 def revoke_user_role(user_id: int, role_id: int) -> bool:
@@ -89,7 +94,10 @@ def revoke_user_role(user_id: int, role_id: int) -> bool:
             """,
             [user_id, role_id],
         )
-        return cursor.rowcount > 0
+        changed = cursor.rowcount > 0
+    if changed:
+        transaction.on_commit(invalidate_rbac)
+    return changed
 
 
 def list_role_permissions(role_id: int) -> list[dict[str, Any]]:
@@ -136,7 +144,10 @@ def assign_role_permission(
             """,
             [role_id, perm_id, _jsonb_param(scope_json), actor_label, actor_label],
         )
-        return cursor.rowcount > 0
+        changed = cursor.rowcount > 0
+    if changed:
+        transaction.on_commit(invalidate_rbac)
+    return changed
 
 
 def revoke_role_permission(role_id: int, perm_id: int) -> bool:
@@ -149,7 +160,10 @@ def revoke_role_permission(role_id: int, perm_id: int) -> bool:
             """,
             [role_id, perm_id],
         )
-        return cursor.rowcount > 0
+        changed = cursor.rowcount > 0
+    if changed:
+        transaction.on_commit(invalidate_rbac)
+    return changed
 
 
 def list_tenant_users(tenant_id: int) -> list[dict[str, Any]]:
@@ -8,7 +8,7 @@ import textwrap
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from django.test import TestCase, override_settings
 
@@ -16,8 +16,10 @@ from masterdata.ifrc_catalogue_loader import parse_taxonomy, IFRCTaxonomy
 from masterdata.ifrc_code_agent import (
     IFRCAgent,
     IFRCCodeSuggestion,
+    _call_ollama,
     _extract_item_segment,
     _extract_vrnt_segment,
+    _get_ollama_client,
     _keyword_classify,
     _llm_classify,
     _standardise_description,
@@ -272,6 +274,28 @@ class TestSegmentExtraction(TestCase):
         self.assertEqual(metadata["material"], "CHLORINE")
 
 
+class TestOllamaClient(TestCase):
+    @patch("masterdata.ifrc_code_agent._ollama_client", None)
+    def test_client_is_created_once_and_reused(self):
+        client = _get_ollama_client()
+        try:
+            self.assertIs(_get_ollama_client(), client)
+        finally:
+            client.close()
+
+    def test_call_ollama_posts_through_shared_client(self):
+        client = MagicMock()
+        client.post.return_value.json.return_value = {
+            "response": '```json\n{"group": "WS"}\n```'
+        }
+        with patch("masterdata.ifrc_code_agent._ollama_client", client):
+            self.assertEqual(_call_ollama("prompt one"), {"group": "WS"})
+            self.assertEqual(_call_ollama("prompt two"), {"group": "WS"})
+
+        self.assertEqual(client.post.call_count, 2)
+        self.assertTrue(client.post.call_args.args[0].endswith("/api/generate"))
+
+
 class TestIFRCAgent(TestCase):
     def setUp(self):
         self.taxonomy_path = _write_temp_taxonomy()
@@ -6,6 +6,8 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import DatabaseError, connection, transaction
 from django.utils import timezone
 
+from api.rbac import invalidate_rbac
+
 
 class Command(BaseCommand):
     help = (
@@ -54,6 +56,7 @@ class Command(BaseCommand):
                 user_ids = [row["user_id"] for row in user_rows]
                 self._deactivate_tenant_memberships(user_ids=user_ids, actor_id=actor_id, now=now)
                 self._delete_user_roles(user_ids=user_ids)
+                transaction.on_commit(invalidate_rbac)
                 self._deactivate_users(user_ids=user_ids, now=now)
             if agency is not None:
                 self._inactivate_agency(agency_id=agency["agency_id"])
@@ -287,6 +287,7 @@ class Command(BaseCommand):
             if link_rows:
                 self._insert_role_permissions(link_rows)
                 created_link_count = len(link_rows)
+                transaction.on_commit(rbac.invalidate_rbac)
 
         self.stdout.write(self.style.SUCCESS("Operations RBAC seed applied."))
         self.stdout.write(
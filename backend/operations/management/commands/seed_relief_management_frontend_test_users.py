@@ -7,6 +7,7 @@ from django.core.management.base import BaseCommand, CommandError
 from django.db import DatabaseError, connection, transaction
 from django.utils import timezone
 
+from api.rbac import invalidate_rbac
 from api.tenant_membership_locks import lock_primary_tenant_membership
 from operations.relief_test_data import (
     TemporaryFrontendUserSpec,
@@ -141,6 +142,8 @@ class Command(BaseCommand):
                         actor_user_id=actor_user_id,
                     )
                 )
+            if role_changes:
+                transaction.on_commit(invalidate_rbac)
 
         self.stdout.write(self.style.SUCCESS("Temporary Relief Management frontend users are ready."))
         self.stdout.write(f"- users created: {created_users}")
@@ -21,6 +21,11 @@ from api.tenancy import (
 from replenishment.services import phase_window_policy
 from replenishment.services.phase_window_policy import PhaseWindowPolicyError
 
+_BACKEND_ERROR_MARKER_RE = re.compile(
+    r"database|storage|connection|timeout|backend|persist|\bdb\b"
+)
+
+
 def _actor_id(request) -> str | None:
     return getattr(request.user, "user_id", None) or getattr(request.user, "username", None)
 
@@ -60,9 +65,7 @@ def _has_phase_window_admin_permission(request) -> bool:
 
 def _phase_window_error_status(exc: Exception) -> int:
     message = str(exc or "").lower()
-    backend_markers = ("database", "storage", "connection", "timeout", "backend", "persist")
-    has_backend_marker = any(marker in message for marker in backend_markers)
-    return 500 if has_backend_marker or re.search(r"\bdb\b", message) else 400
+    return 500 if _BACKEND_ERROR_MARKER_RE.search(message) else 400
 
 
 @api_view(["GET"])
@@ -142,15 +142,12 @@ def merge_warnings(base: Iterable[str], extra: Iterable[str]) -> List[str]:
     return list(dict.fromkeys(list(base) + list(extra)))
 
 
+_EXPORT_REFERENCE_STRIP_TABLE = str.maketrans("", "", '\r\n"')
+
+
 def safe_export_reference(value: object, fallback: object) -> str:
     def _clean(raw: object) -> str:
-        return (
-            str(raw or "")
-            .replace("\r", "")
-            .replace("\n", "")
-            .replace('"', "")
-            .strip()
-        )
+        return str(raw or "").translate(_EXPORT_REFERENCE_STRIP_TABLE).strip()
 
     cleaned = _clean(value)
     if cleaned:
@@ -102,6 +102,20 @@ class ReplenishmentRequestIpTests(SimpleTestCase):
 
         self.assertEqual(views._request_client_ip(request), "198.51.100.77")
 
+    def test_request_client_ip_is_resolved_once_per_request(self) -> None:
+        request = self.factory.get(
+            "/api/v1/replenishment/needs-list/NL-A/donations/export",
+            REMOTE_ADDR="10.0.0.25",
+        )
+
+        with patch.object(
+            views, "_trusted_proxy_ip_set", return_value=set()
+        ) as trusted_proxy_ip_set:
+            self.assertEqual(views._request_client_ip(request), "10.0.0.25")
+            self.assertEqual(views._request_client_ip(request), "10.0.0.25")
+
+        trusted_proxy_ip_set.assert_called_once_with()
+
 
 class ReplenishmentBootstrapTests(SimpleTestCase):
     @patch("replenishment.workflow_store_db._ensure_workflow_metadata_table")
@@ -138,6 +138,9 @@ _NEEDS_LIST_EXECUTION_STATUSES = {
 }
 INACTIVE_ITEM_FORWARD_WRITE_CODE = "inactive_item_forward_write_blocked"
 STRICT_INBOUND_VIEW_MISSING_CODE = "strict_inbound_workflow_view_missing"
+_SIGNED_INT_RE = re.compile(r"[+-]?\d+")
+_SELECTED_ITEM_KEY_RE = re.compile(r"\d+_\d+")
+_ISO_DATE_ONLY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 
 def _record_for_task_context(context: Mapping[str, Any]) -> Dict[str, Any]:
@@ -321,7 +324,7 @@ def _parse_positive_int(value: Any, field_name: str, errors: Dict[str, str]) ->
         return None
     if isinstance(value, str):
         stripped = value.strip()
-        if not stripped or not re.fullmatch(r"[+-]?\d+", stripped):
+        if not stripped or not _SIGNED_INT_RE.fullmatch(stripped):
             errors[field_name] = "Must be an integer."
             return None
         value = stripped
@@ -387,7 +390,7 @@ def _parse_selected_item_keys(
             errors[field_name] = f"Invalid key at index {idx}."
             return None
         normalized = key.strip()
-        if not re.fullmatch(r"\d+_\d+", normalized):
+        if not _SELECTED_ITEM_KEY_RE.fullmatch(normalized):
             errors[field_name] = f"Invalid key format at index {idx}."
             return None
         parsed.add(normalized)
@@ -1102,21 +1105,7 @@ def _query_param_truthy(value: object, *, default: bool = False) -> bool:
 
 
 def _safe_content_disposition_ref(value: object, fallback: object) -> str:
-    def _clean(raw: object) -> str:
-        cleaned = (
-            str(raw or "")
-            .replace("\r", "")
-            .replace("\n", "")
-            .replace('"', "")
-            .strip()
-        )
-        return cleaned
-
-    cleaned = _clean(value)
-    if cleaned:
-        return cleaned
-    fallback_cleaned = _clean(fallback)
-    return fallback_cleaned or "needs_list"
+    return needs_list.safe_export_reference(value, fallback)
 
 
 _ASYNC_EXPORT_JOB_TYPES = {
@@ -1205,6 +1194,17 @@ def _async_export_dedupe_key(
 
 
 def _request_client_ip(request) -> str:
+    # Both the export and high-risk limiters resolve the client IP; memoize it
+    # on the request so TRUSTED_PROXIES is parsed at most once per request.
+    cached = getattr(request, "_client_ip_cache", None)
+    if cached is not None:
+        return cached
+    client_ip = _resolve_request_client_ip(request)
+    request._client_ip_cache = client_ip
+    return client_ip
+
+
+def _resolve_request_client_ip(request) -> str:
     remote_addr = _normalize_ip_address(request.META.get("REMOTE_ADDR"))
     if not remote_addr:
         return "-"
@@ -3425,7 +3425,7 @@ def needs_list_my_submissions(request):
     if (
         date_to is not None
         and isinstance(date_to_raw, str)
-        and re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_to_raw.strip())
+        and _ISO_DATE_ONLY_RE.fullmatch(date_to_raw.strip())
     ):
         # Treat day-only end filters as inclusive through end-of-day.
         date_to = date_to + timedelta(days=1) - timedelta(microseconds=1)
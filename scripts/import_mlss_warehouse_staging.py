@@ -17,6 +17,7 @@ Enhancements:
 """
 
 import argparse
+import functools
 import os
 import re
 import sys
@@ -75,13 +76,14 @@ def normalize_uom(raw_unit: Optional[str]) -> str:
     if not raw_unit_str:
         return 'ea'
     
-    # Check normalization map (case-insensitive)
+    # Check normalization map (keys are lowercase, so lower once and reuse)
     raw_lower = raw_unit_str.lower()
-    if raw_lower in UOM_NORMALIZATION_MAP:
-        return UOM_NORMALIZATION_MAP[raw_lower]
+    normalized = UOM_NORMALIZATION_MAP.get(raw_lower)
+    if normalized is not None:
+        return normalized
     
     # Return original (lowercase) if no mapping found, truncated to 25 chars
-    return raw_unit_str.lower()[:25]
+    return raw_lower[:25]
 
 
 def safe_decimal(value, default=None) -> Optional[Decimal]:
@@ -109,57 +111,63 @@ def safe_date(value) -> Optional[date]:
         return None
 
 
-def categorize_item(item_desc: str) -> str:
-    """Determine category code based on item description."""
-    item_lower = item_desc.lower()
-    
+# Category keyword lists, checked in priority order. A description is assigned
+# the first category with any keyword occurring as a substring.
+_CATEGORY_KEYWORDS = (
     # Food & Water items
-    food_keywords = [
+    ('FOOD_WATER', (
         'sugar', 'cornmeal', 'crackers', 'vegetables', 'lasco', 'peas', 'rice',
         'beans', 'mackerel', 'sardine', 'corn beef', 'sausage', 'flour', 'oil',
         'oats', 'cup soup', 'food package', 'snack', 'water', 'chicken', 'tea',
         'syrup', 'coconut', 'pepsi', 'schweppes', 'drink', 'meal', 'cereal',
         'vienna', 'baked bean', 'cooking'
-    ]
-    
+    )),
     # Hygiene items
-    hygiene_keywords = [
+    ('HYGIENE', (
         'soap', 'hygiene', 'tissue', 'bleach', 'disinfectant', 'sanitizer',
         'toothbrush', 'shaving', 'diaper', 'towel', 'sanitation'
-    ]
-    
+    )),
     # Shelter/NFI items
-    shelter_keywords = [
+    ('SHELTER', (
         'mattress', 'tarpaulin', 'tarparlin', 'tent', 'cot', 'blanket',
         'dinnerware', 'bucket', 'mosquito', 'stove', 'gas', 'bungee'
-    ]
-    
+    )),
     # Logistics items
-    logistics_keywords = [
+    ('LOGS_ENGR', (
         'generator', 'lantern', 'flashlight', 'rope', 'tool', 'packing',
         'packaging', 'bag'
-    ]
-    
-    for kw in food_keywords:
-        if kw in item_lower:
-            return 'FOOD_WATER'
-    
-    for kw in hygiene_keywords:
-        if kw in item_lower:
-            return 'HYGIENE'
-    
-    for kw in shelter_keywords:
-        if kw in item_lower:
-            return 'SHELTER'
+    )),
+)
+
+# One compiled alternation per category so each description is scanned once
+# per category instead of once per keyword.
+_CATEGORY_PATTERNS = tuple(
+    (category_code, re.compile('|'.join(re.escape(kw) for kw in keywords)))
+    for category_code, keywords in _CATEGORY_KEYWORDS
+)
+
+
+# Item descriptions repeat heavily across rows and sheets, so the pure
+# per-item helpers below are memoized for the life of the import.
+@functools.lru_cache(maxsize=None)
+def categorize_item(item_desc: str) -> str:
+    """Determine category code based on item description."""
+    item_lower = item_desc.lower()
     
-    for kw in logistics_keywords:
-        if kw in item_lower:
-            return 'LOGS_ENGR'
+    for category_code, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(item_lower):
+            return category_code
     
     # Default to FOOD_WATER for this dataset (primarily food distribution)
     return 'FOOD_WATER'
 
 
+# Trailing parenthetical unit label, e.g. "Rice (bag)".
+# The content may include special chars such as "6*27" or "18x30 & 20x30".
+_TRAILING_UNIT_RE = re.compile(r'\s*\(([^)]+)\)\s*$')
+
+
+@functools.lru_cache(maxsize=None)
 def extract_unit_from_item(item_desc: str) -> tuple[str, str]:
     """
     Extract unit label from item description if present.
@@ -170,12 +178,12 @@ def extract_unit_from_item(item_desc: str) -> tuple[str, str]:
     Returns:
         Tuple of (clean_item_description, normalized_unit)
     """
-    # Match parenthetical content at end of item description
-    # This pattern captures content in parentheses that may include special chars
-    match = re.search(r'\(([^)]+)\)\s*$', item_desc)
+    # Match parenthetical content at end of item description; the match start
+    # marks where the clean description ends, so no second pass is needed.
+    match = _TRAILING_UNIT_RE.search(item_desc)
     if match:
         raw_unit = match.group(1).strip()
-        clean_item = re.sub(r'\s*\([^)]+\)\s*$', '', item_desc).strip()
+        clean_item = item_desc[:match.start()].strip()
         # Apply UOM normalization to extracted unit
         normalized_unit = normalize_uom(raw_unit)
         return clean_item, normalized_unit
@@ -204,11 +212,41 @@ def build_comments_with_donor(comments_parts: list, donor: Optional[str] = None)
     # Use provided donor or default to GOJ
     donor_name = donor.strip() if donor and str(donor).strip() else DEFAULT_DONOR
     
-    # Add donor to comments
-    all_parts = list(comments_parts)  # Copy to avoid mutation
-    all_parts.append(f"Donor: {donor_name}")
+    # Add donor to comments (appended to the joined string, so the caller's
+    # list is neither mutated nor copied)
+    donor_part = f"Donor: {donor_name}"
+    if not comments_parts:
+        return donor_part
+    return f"{'; '.join(comments_parts)}; {donor_part}"
+
+
+# Fixed comments for sheets whose cells carry no per-row detail; built once
+# instead of once per quantity cell.
+# Procurement items are from GOJ (government purchases)
+_PROCUREMENT_COMMENTS = build_comments_with_donor(["Procurement"], None)
+# Staff consumption uses GOJ as donor (internal use)
+_STAFF_CONSUMPTION_COMMENTS = build_comments_with_donor(["Staff consumption"], None)
+
+# Reads the donor back out of comments_text for the import summary.
+_DONOR_COMMENT_RE = re.compile(r'Donor:\s*([^;]+)')
+
+
+def iter_rows(df: pd.DataFrame, start: int = 0):
+    """
+    Yield (row_idx, row) pairs with each row as a plain tuple.
     
-    return '; '.join(all_parts)
+    df.iloc[row_idx] builds a new pandas Series for every row, which dominates
+    parse time on large sheets; itertuples() walks the columns once instead.
+    Entirely blank rows (common at sheet tails) are skipped using a single
+    vectorized null check; no parser emits records or changes its carried
+    date/location state on such rows.
+    """
+    frame = df.iloc[start:]
+    blank = frame.isna().all(axis=1).to_numpy()
+    rows = frame.itertuples(index=False, name=None)
+    for row_idx, (row, is_blank) in enumerate(zip(rows, blank), start=start):
+        if not is_blank:
+            yield row_idx, row
 
 
 def parse_package_distributions(df: pd.DataFrame, sheet_name: str) -> list[dict]:
@@ -216,34 +254,33 @@ def parse_package_distributions(df: pd.DataFrame, sheet_name: str) -> list[dict]
     records = []
     current_date = None
     
-    for row_idx in range(len(df)):
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df):
         
         # Check for date in column 1
-        date_val = safe_date(row.iloc[1])
+        date_val = safe_date(row[1])
         if date_val:
             current_date = date_val
             continue
         
         # Skip header rows and total rows
-        if pd.isna(row.iloc[0]) or str(row.iloc[0]).strip().lower() in ['ser', 'nan', '']:
+        if pd.isna(row[0]) or str(row[0]).strip().lower() in ['ser', 'nan', '']:
             continue
-        if str(row.iloc[1]).strip().lower() == 'total':
+        if str(row[1]).strip().lower() == 'total':
             continue
         
         # Try to get serial number - indicates a data row
         try:
-            ser = int(float(row.iloc[0]))
+            ser = int(float(row[0]))
         except (ValueError, TypeError):
             continue
         
-        amount = safe_decimal(row.iloc[2])
+        amount = safe_decimal(row[2])
         if not amount or not current_date:
             continue
         
-        location = str(row.iloc[3]).strip() if pd.notna(row.iloc[3]) else None
-        collected_by = str(row.iloc[4]).strip() if pd.notna(row.iloc[4]) else None
-        remarks = str(row.iloc[5]).strip() if len(row) > 5 and pd.notna(row.iloc[5]) else None
+        location = str(row[3]).strip() if pd.notna(row[3]) else None
+        collected_by = str(row[4]).strip() if pd.notna(row[4]) else None
+        remarks = str(row[5]).strip() if len(row) > 5 and pd.notna(row[5]) else None
         
         # Build comments (donor defaults to GOJ for non-donation sheets)
         comments_parts = []
@@ -282,48 +319,47 @@ def parse_bulk_items_distributed(df: pd.DataFrame, sheet_name: str) -> list[dict
     current_date = None
     current_location = None
     
-    for row_idx in range(len(df)):
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df):
         
         # Check for date in column 0
-        date_val = safe_date(row.iloc[0])
+        date_val = safe_date(row[0])
         if date_val:
             current_date = date_val
             current_location = None
             continue
         
         # Skip header rows
-        if pd.isna(row.iloc[0]) or str(row.iloc[0]).strip().lower() in ['ser', 'nan', '']:
-            if pd.notna(row.iloc[1]) and str(row.iloc[1]).strip().lower() == 'items':
+        if pd.isna(row[0]) or str(row[0]).strip().lower() in ['ser', 'nan', '']:
+            if pd.notna(row[1]) and str(row[1]).strip().lower() == 'items':
                 continue
             # Check if this row has location info
-            if pd.notna(row.iloc[4]):
-                current_location = str(row.iloc[4]).strip()
+            if pd.notna(row[4]):
+                current_location = str(row[4]).strip()
         
         # Try to get serial number
         try:
-            ser = int(float(row.iloc[0]))
+            ser = int(float(row[0]))
         except (ValueError, TypeError):
             # Check for continuation rows (no serial but has amount)
-            if pd.notna(row.iloc[2]) and safe_decimal(row.iloc[2]):
+            if pd.notna(row[2]) and safe_decimal(row[2]):
                 pass
             else:
                 continue
         
-        item = row.iloc[1]
-        if pd.isna(item) or not str(item).strip():
+        item = row[1]
+        item_desc = '' if pd.isna(item) else str(item).strip()
+        if not item_desc:
             continue
         
-        item_desc = str(item).strip()
-        amount = safe_decimal(row.iloc[2])
+        amount = safe_decimal(row[2])
         
         if not amount or not current_date:
             continue
         
-        raw_unit = str(row.iloc[3]).strip() if pd.notna(row.iloc[3]) else None
-        location = str(row.iloc[4]).strip() if pd.notna(row.iloc[4]) else current_location
-        collected_by = str(row.iloc[5]).strip() if len(row) > 5 and pd.notna(row.iloc[5]) else None
-        remarks = str(row.iloc[6]).strip() if len(row) > 6 and pd.notna(row.iloc[6]) else None
+        raw_unit = str(row[3]).strip() if pd.notna(row[3]) else None
+        location = str(row[4]).strip() if pd.notna(row[4]) else current_location
+        collected_by = str(row[5]).strip() if len(row) > 5 and pd.notna(row[5]) else None
+        remarks = str(row[6]).strip() if len(row) > 6 and pd.notna(row[6]) else None
         
         # Update current location if provided
         if location:
@@ -371,21 +407,20 @@ def parse_snack_packages(df: pd.DataFrame, sheet_name: str) -> list[dict]:
     records = []
     current_date = None
     
-    for row_idx in range(3, len(df)):  # Skip header rows
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df, 3):  # Skip header rows
         
         # Check for date in column 1
-        date_val = safe_date(row.iloc[1])
+        date_val = safe_date(row[1])
         if date_val:
             current_date = date_val
         
-        amount = safe_decimal(row.iloc[2])
+        amount = safe_decimal(row[2])
         if not amount or not current_date:
             continue
         
-        location = str(row.iloc[3]).strip() if pd.notna(row.iloc[3]) else None
-        collected_by = str(row.iloc[4]).strip() if pd.notna(row.iloc[4]) else None
-        remarks = str(row.iloc[5]).strip() if len(row) > 5 and pd.notna(row.iloc[5]) else None
+        location = str(row[3]).strip() if pd.notna(row[3]) else None
+        collected_by = str(row[4]).strip() if pd.notna(row[4]) else None
+        remarks = str(row[5]).strip() if len(row) > 5 and pd.notna(row[5]) else None
         
         comments_parts = []
         if location:
@@ -421,16 +456,15 @@ def parse_packages_produced(df: pd.DataFrame, sheet_name: str) -> list[dict]:
     """Parse Packages produced per day sheet - internal production (Received into inventory)."""
     records = []
     
-    for row_idx in range(3, len(df)):  # Skip header rows
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df, 3):  # Skip header rows
         
-        date_val = safe_date(row.iloc[1])
+        date_val = safe_date(row[1])
         if not date_val:
             continue
         
-        completed = safe_decimal(row.iloc[2])
-        partial = safe_decimal(row.iloc[3])
-        remarks = str(row.iloc[4]).strip() if pd.notna(row.iloc[4]) else None
+        completed = safe_decimal(row[2])
+        partial = safe_decimal(row[3])
+        remarks = str(row[4]).strip() if pd.notna(row[4]) else None
         
         # Record completed packages as received
         # Production records use GOJ as donor (government operation)
@@ -504,28 +538,26 @@ def parse_items_donated(df: pd.DataFrame, sheet_name: str) -> list[dict]:
     current_date = None
     current_entity = None  # Track entity for rows that inherit from previous row
     
-    for row_idx in range(2, len(df)):  # Skip header rows
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df, 2):  # Skip header rows
         
         # Check for date
-        date_val = safe_date(row.iloc[1])
+        date_val = safe_date(row[1])
         if date_val:
             current_date = date_val
             current_entity = None  # Reset entity when date changes
         
         # Special handling for "3 Novemeber" text date
-        if pd.notna(row.iloc[1]) and 'novem' in str(row.iloc[1]).lower():
+        if pd.notna(row[1]) and 'novem' in str(row[1]).lower():
             current_date = date(2025, 11, 3)
         
         if not current_date:
             continue
         
-        item = row.iloc[2]
-        if pd.isna(item) or not str(item).strip():
+        item = row[2]
+        item_desc = '' if pd.isna(item) else str(item).strip()
+        if not item_desc:
             continue
         
-        item_desc = str(item).strip()
-        
         # =================================================================
         # DONOR EXTRACTION from Entity column (column index 3)
         # =================================================================
@@ -533,14 +565,15 @@ def parse_items_donated(df: pd.DataFrame, sheet_name: str) -> list[dict]:
         # If present, use it as the donor and remember it for subsequent rows.
         # If absent, use the last known entity or default to GOJ.
         # =================================================================
-        entity_value = row.iloc[3] if len(row) > 3 else None
-        if pd.notna(entity_value) and str(entity_value).strip():
-            current_entity = str(entity_value).strip()
+        entity_value = row[3] if len(row) > 3 else None
+        entity_text = str(entity_value).strip() if pd.notna(entity_value) else ''
+        if entity_text:
+            current_entity = entity_text
         
         # Donor is either the current entity or defaults to GOJ
         donor = current_entity if current_entity else DEFAULT_DONOR
         
-        qty = safe_decimal(row.iloc[4])
+        qty = safe_decimal(row[4])
         
         if not qty:
             continue
@@ -582,27 +615,24 @@ def parse_goods_received_procurement(df: pd.DataFrame, sheet_name: str) -> list[
             date_cols[col_idx] = date_val
     
     # Process item rows (starting from row 2)
-    for row_idx in range(2, len(df)):
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df, 2):
         
-        item = row.iloc[1]
-        if pd.isna(item) or not str(item).strip():
+        item = row[1]
+        item_desc = '' if pd.isna(item) else str(item).strip()
+        if not item_desc:
             continue
         
-        item_desc = str(item).strip()
         item_clean, unit = extract_unit_from_item(item_desc)
+        category_code = categorize_item(item_desc)
         
         # Process each date column
         for col_idx, movement_date in date_cols.items():
-            qty = safe_decimal(row.iloc[col_idx])
+            qty = safe_decimal(row[col_idx])
             if not qty:
                 continue
             
-            # Procurement items are from GOJ (government purchases)
-            comments_text = build_comments_with_donor(["Procurement"], None)
-            
             records.append({
-                'category_code': categorize_item(item_desc),
+                'category_code': category_code,
                 'item_desc': item_clean,
                 'unit_label': unit,
                 'warehouse_code': DEFAULT_WAREHOUSE,
@@ -614,7 +644,7 @@ def parse_goods_received_procurement(df: pd.DataFrame, sheet_name: str) -> list[
                 'source_sheet': sheet_name.strip(),
                 'source_row_nbr': row_idx + 1,
                 'source_col_idx': col_idx,
-                'comments_text': comments_text,
+                'comments_text': _PROCUREMENT_COMMENTS,
             })
     
     return records
@@ -632,25 +662,22 @@ def parse_staff_items(df: pd.DataFrame, sheet_name: str) -> list[dict]:
             date_cols[col_idx] = date_val
     
     # Process item rows (starting from row 2)
-    for row_idx in range(2, len(df)):
-        row = df.iloc[row_idx]
+    for row_idx, row in iter_rows(df, 2):
         
-        item = row.iloc[0]
-        if pd.isna(item) or not str(item).strip():
+        item = row[0]
+        item_desc = '' if pd.isna(item) else str(item).strip()
+        if not item_desc:
             continue
         
-        item_desc = str(item).strip()
+        category_code = categorize_item(item_desc)
         
         for col_idx, movement_date in date_cols.items():
-            qty = safe_decimal(row.iloc[col_idx])
+            qty = safe_decimal(row[col_idx])
             if not qty:
                 continue
             
-            # Staff consumption uses GOJ as donor (internal use)
-            comments_text = build_comments_with_donor(["Staff consumption"], None)
-            
             records.append({
-                'category_code': categorize_item(item_desc),
+                'category_code': category_code,
                 'item_desc': item_desc,
                 'unit_label': normalize_uom('ea'),
                 'warehouse_code': DEFAULT_WAREHOUSE,
@@ -662,15 +689,34 @@ def parse_staff_items(df: pd.DataFrame, sheet_name: str) -> list[dict]:
                 'source_sheet': sheet_name.strip(),
                 'source_row_nbr': row_idx + 1,
                 'source_col_idx': col_idx,
-                'comments_text': comments_text,
+                'comments_text': _STAFF_CONSUMPTION_COMMENTS,
             })
     
     return records
 
 
+def open_workbook(excel_path: str) -> pd.ExcelFile:
+    """
+    Open the workbook, preferring the calamine engine when it is available.
+    
+    python-calamine (Rust) decodes .xlsx several times faster than the
+    default openpyxl engine. It is optional: without it, or on pandas older
+    than 2.2, the default engine is used.
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return pd.ExcelFile(excel_path)
+    try:
+        return pd.ExcelFile(excel_path, engine='calamine')
+    except ValueError:
+        # pandas < 2.2 does not know the calamine engine
+        return pd.ExcelFile(excel_path)
+
+
 def parse_excel_data(excel_path: str) -> list[dict]:
     """Parse the Excel file and extract all movement records."""
-    xlsx = pd.ExcelFile(excel_path)
+    xlsx = open_workbook(excel_path)
     records = []
     
     sheet_parsers = {
@@ -717,7 +763,9 @@ def insert_records(records: list[dict], db_url: str, create_by_id: str = 'MLSS_I
         ) VALUES %s
     """
     
-    values = [
+    # Generator, not a list: execute_values pages through it, so the full
+    # parameter set is never held in memory alongside the records.
+    values = (
         (
             r['category_code'],
             r['item_desc'],
@@ -735,10 +783,10 @@ def insert_records(records: list[dict], db_url: str, create_by_id: str = 'MLSS_I
             create_by_id,
         )
         for r in records
-    ]
+    )
     
     try:
-        execute_values(cur, insert_sql, values, page_size=1000)
+        execute_values(cur, insert_sql, values, page_size=5000)
         conn.commit()
         print(f"Successfully inserted {len(records)} records")
     except Exception as e:
@@ -749,6 +797,30 @@ def insert_records(records: list[dict], db_url: str, create_by_id: str = 'MLSS_I
         conn.close()
 
 
+# Escapes single quotes for SQL string literals in generated INSERT files.
+_SQL_QUOTE_TABLE = str.maketrans({"'": "''"})
+
+
+def _sql_values_row(r: dict, create_by_id: str) -> str:
+    """Format one record as an indented SQL VALUES tuple."""
+    unit_cost = f"{float(r['unit_cost_usd']):.2f}" if r['unit_cost_usd'] else "NULL"
+    total_cost = f"{float(r['total_cost_usd']):.2f}" if r['total_cost_usd'] else "NULL"
+    
+    # Escape single quotes
+    item_desc = r['item_desc'].translate(_SQL_QUOTE_TABLE)
+    source_sheet = r['source_sheet'].translate(_SQL_QUOTE_TABLE)
+    comments = f"'{r['comments_text'].translate(_SQL_QUOTE_TABLE)}'" if r['comments_text'] else "NULL"
+    
+    return (
+        f"    ('{r['category_code']}', '{item_desc}', "
+        f"'{r['unit_label']}', '{r['warehouse_code']}', "
+        f"'{r['movement_date']}', '{r['movement_type']}', "
+        f"{float(r['qty']):.2f}, {unit_cost}, {total_cost}, "
+        f"'{source_sheet}', {r['source_row_nbr']}, {r['source_col_idx']}, "
+        f"{comments}, '{create_by_id}')"
+    )
+
+
 def generate_sql_inserts(records: list[dict], output_path: str, create_by_id: str = 'MLSS_IMPORT'):
     """Generate SQL INSERT statements to a file."""
     with open(output_path, 'w') as f:
@@ -763,28 +835,11 @@ def generate_sql_inserts(records: list[dict], output_path: str, create_by_id: st
         f.write("    create_by_id\n")
         f.write(") VALUES\n")
         
-        for i, r in enumerate(records):
-            unit_cost = f"{float(r['unit_cost_usd']):.2f}" if r['unit_cost_usd'] else "NULL"
-            total_cost = f"{float(r['total_cost_usd']):.2f}" if r['total_cost_usd'] else "NULL"
-            
-            # Escape single quotes
-            item_desc = r['item_desc'].replace("'", "''")
-            source_sheet = r['source_sheet'].replace("'", "''")
-            comments = f"'{r['comments_text'].replace(chr(39), chr(39)+chr(39))}'" if r['comments_text'] else "NULL"
-            
-            line = (
-                f"('{r['category_code']}', '{item_desc}', "
-                f"'{r['unit_label']}', '{r['warehouse_code']}', "
-                f"'{r['movement_date']}', '{r['movement_type']}', "
-                f"{float(r['qty']):.2f}, {unit_cost}, {total_cost}, "
-                f"'{source_sheet}', {r['source_row_nbr']}, {r['source_col_idx']}, "
-                f"{comments}, '{create_by_id}')"
-            )
-            
-            if i < len(records) - 1:
-                f.write(f"    {line},\n")
-            else:
-                f.write(f"    {line};\n")
+        # Build all VALUES rows and write them in one call instead of one
+        # write per record.
+        if records:
+            f.write(",\n".join(_sql_values_row(r, create_by_id) for r in records))
+            f.write(";\n")
     
     print(f"Generated SQL file: {output_path}")
 
@@ -821,7 +876,7 @@ def main():
         movement_types[r['movement_type']] += 1
         # Extract donor from comments for summary
         if r['comments_text'] and 'Donor:' in r['comments_text']:
-            donor_match = re.search(r'Donor:\s*([^;]+)', r['comments_text'])
+            donor_match = _DONOR_COMMENT_RE.search(r['comments_text'])
             if donor_match:
                 donor_name = donor_match.group(1).strip()
                 donors[donor_name] = donors.get(donor_name, 0) + 1
@@ -22,6 +22,11 @@ import sys
 from pathlib import Path
 
 
+# Read/write buffer size for the dump files. Large buffers turn the per-line
+# reads and writes into a few big syscalls on multi-GB dumps.
+IO_BUFFER_SIZE = 1 << 22
+
+
 # Tables whose data should be PRESERVED (case-insensitive matching)
 # Note: "items" -> "item", "unit_of_measure" -> "unitofmeasure" based on actual schema
 TABLES_TO_PRESERVE = {
@@ -78,66 +83,53 @@ def process_dump(input_path: str, output_path: str) -> dict:
     # Pattern to match COPY ... FROM stdin statements
     # Matches: COPY public.tablename (...) FROM stdin;
     # Also matches: COPY public."tablename" (...) FROM stdin;
+    # Works on raw bytes; \x80-\xff keeps UTF-8 encoded (non-ASCII) table
+    # names matching as they did with str \w.
     copy_pattern = re.compile(
-        r'^COPY\s+(?:public\.)?(["\w]+)\s*\([^)]*\)\s+FROM\s+stdin;',
+        rb'^COPY\s+(?:public\.)?(["\w\x80-\xff]+)\s*\([^)]*\)\s+FROM\s+stdin;',
         re.IGNORECASE
     )
     
-    with open(input_path, 'r', encoding='utf-8') as infile:
-        lines = infile.readlines()
-    
-    stats['total_lines'] = len(lines)
-    
-    output_lines = []
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i]
-        
-        # Check if this line starts a COPY block
-        match = copy_pattern.match(line)
-        
-        if match:
-            table_name = match.group(1)
-            stats['copy_blocks_processed'] += 1
+    # Stream the dump line by line so memory stays flat regardless of dump
+    # size; lines are written out as soon as they are classified. The dump is
+    # handled as bytes: only ASCII markers (COPY headers, \.) are inspected,
+    # so decoding and re-encoding every data row would be wasted work.
+    in_copy_block = False   # between a COPY header and its terminator
+    keep_copy_data = False  # whether the current block's data rows are kept
+    
+    with open(input_path, 'rb', buffering=IO_BUFFER_SIZE) as infile, \
+            open(output_path, 'wb', buffering=IO_BUFFER_SIZE) as outfile:
+        for line in infile:
+            stats['total_lines'] += 1
             
-            if should_preserve_table(table_name):
-                # Keep this COPY block (header + data + terminator)
-                stats['tables_preserved'].append(normalize_table_name(table_name))
-                output_lines.append(line)
-                i += 1
-                
-                # Copy all data lines until we hit the terminator (\.)
-                while i < len(lines) and lines[i].strip() != '\\.':
-                    output_lines.append(lines[i])
-                    i += 1
-                
-                # Copy the terminator
-                if i < len(lines):
-                    output_lines.append(lines[i])
-                    i += 1
-            else:
-                # Purge this table's data - keep COPY header but replace data with empty
-                stats['tables_purged'].append(normalize_table_name(table_name))
-                output_lines.append(line)
-                i += 1
-                
-                # Skip all data lines until terminator
-                while i < len(lines) and lines[i].strip() != '\\.':
-                    i += 1
+            if in_copy_block:
+                if line.strip() == b'\\.':
+                    # Terminator is always kept (purged blocks become empty)
+                    outfile.write(line)
+                    in_copy_block = False
+                elif keep_copy_data:
+                    outfile.write(line)
+                continue
+            
+            # Check if this line starts a COPY block; the cheap prefix test
+            # keeps the regex off the (vast majority of) non-COPY lines
+            match = copy_pattern.match(line) if line[:4].upper() == b'COPY' else None
+            
+            if match:
+                table_name = match.group(1).decode('utf-8')
+                stats['copy_blocks_processed'] += 1
+                in_copy_block = True
+                keep_copy_data = should_preserve_table(table_name)
                 
-                # Keep the terminator (empty COPY block)
-                if i < len(lines):
-                    output_lines.append(lines[i])
-                    i += 1
-        else:
-            # Not a COPY line - keep it as-is
-            output_lines.append(line)
-            i += 1
-    
-    # Write output
-    with open(output_path, 'w', encoding='utf-8') as outfile:
-        outfile.writelines(output_lines)
+                if keep_copy_data:
+                    # Keep this COPY block (header + data + terminator)
+                    stats['tables_preserved'].append(normalize_table_name(table_name))
+                else:
+                    # Purge this table's data - keep COPY header but replace data with empty
+                    stats['tables_purged'].append(normalize_table_name(table_name))
+            
+            # COPY headers and non-COPY lines are kept as-is
+            outfile.write(line)
     
     # Deduplicate and sort stats lists
     stats['tables_preserved'] = sorted(set(stats['tables_preserved']))